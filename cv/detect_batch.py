@@ -0,0 +1,186 @@
+# Plaka Tespiti - Toplu Tespit (CPU)
+# Eğitilmiş YOLO ağırlıklarını bir kez yükler, bir klasördeki görüntüleri veya bir videonun
+# karelerini arka plandaki thread'lerde çözümler (decode), tespiti batch'ler halinde yapar
+# ve sonuçları JSON Lines olarak yazar. Videoda ardışık neredeyse aynı kareler modele
+# verilmez, bir önceki karenin tespitleri kullanılır.
+#
+# Kullanım:
+#   python detect_batch.py dataset/images --output tespitler.jsonl
+#   python detect_batch.py trafik.mp4 --output tespitler.jsonl --batch 16
+
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+from ultralytics import YOLO
+
+WEIGHTS_PATH = os.path.join("runs", "detect", "train", "weights", "best.pt")
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+_DONE = object()
+
+class StageTimer:
+    """Aşama bazlı toplam süreleri tutar"""
+
+    def __init__(self):
+        self.totals = {}
+        self.lock = threading.Lock()
+
+    def add(self, stage, seconds):
+        with self.lock:
+            self.totals[stage] = self.totals.get(stage, 0.0) + seconds
+
+def _produce_images(paths, out_queue, timer, workers):
+    # Görüntüler thread havuzunda çözülür, sıra korunarak kuyruğa konur
+    def decode(path):
+        start = time.perf_counter()
+        img = cv2.imread(path)
+        timer.add("decode", time.perf_counter() - start)
+        return path, img
+
+    window = workers * 4  # Bellekte aynı anda bekleyen en fazla görüntü
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for start in range(0, len(paths), window):
+            for i, (path, img) in enumerate(executor.map(decode, paths[start:start + window]), start):
+                if img is not None:
+                    out_queue.put((os.path.basename(path), i, img))
+    out_queue.put(_DONE)
+
+def _produce_video(path, out_queue, timer):
+    # Video kareleri sıralı okunmak zorunda => tek bir arka plan thread'i
+    capture = cv2.VideoCapture(path)
+    source = os.path.basename(path)
+    i = 0
+    while True:
+        start = time.perf_counter()
+        ok, frame = capture.read()
+        timer.add("decode", time.perf_counter() - start)
+        if not ok:
+            break
+        out_queue.put((source, i, frame))
+        i += 1
+    capture.release()
+    out_queue.put(_DONE)
+
+def frame_signature(frame, size=32):
+    """Kare karşılaştırması için küçük gri tonlu özet"""
+    small = cv2.resize(frame, (size, size), interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY).astype(np.int16)
+
+def _boxes_to_dicts(result):
+    boxes = result.boxes
+    return [
+        {"xyxy": [round(float(v), 1) for v in xyxy], "conf": round(float(conf), 4), "cls": int(cls)}
+        for xyxy, conf, cls in zip(boxes.xyxy.tolist(), boxes.conf.tolist(), boxes.cls.tolist())
+    ]
+
+def detect(source, output_path, weights=WEIGHTS_PATH, batch_size=8, imgsz=640, conf=0.25,
+           workers=4, dedup_threshold=2.0):
+    """
+    Görüntü klasörü veya video üzerinde toplu tespit yapar
+
+    - **dedup_threshold**: Ardışık iki karenin 32x32 gri özetleri arasındaki ortalama mutlak
+      fark bu değerin altındaysa kare modele verilmez (0 => kapalı, yalnızca video)
+    """
+    timer = StageTimer()
+    model = YOLO(weights)
+    frames = queue.Queue(maxsize=batch_size * 4)
+
+    is_video = os.path.isfile(source) and not source.lower().endswith(IMAGE_EXTENSIONS)
+    if is_video:
+        producer = threading.Thread(target=_produce_video, args=(source, frames, timer), daemon=True)
+    else:
+        paths = [source] if os.path.isfile(source) else sorted(
+            os.path.join(source, f) for f in os.listdir(source) if f.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        producer = threading.Thread(target=_produce_images, args=(paths, frames, timer, workers), daemon=True)
+
+    n_frames = n_inferred = 0
+    last_signature = None
+    last_detections = []
+    start_total = time.perf_counter()
+    producer.start()
+
+    with open(output_path, 'w', encoding='utf-8') as out:
+        done = False
+        while not done:
+            # 1. Batch toplama ve tekrar eden kareleri ayıklama
+            # Kuyrukta bekleme süresi de bu aşamaya dahildir (decode darboğazını gösterir)
+            batch = []  # (kaynak, indeks, kare veya None)
+            n_new = 0
+            t0 = time.perf_counter()
+            while n_new < batch_size:
+                item = frames.get()
+                if item is _DONE:
+                    done = True
+                    break
+                source_name, i, frame = item
+                if is_video and dedup_threshold > 0:
+                    signature = frame_signature(frame)
+                    if last_signature is not None and np.abs(signature - last_signature).mean() < dedup_threshold:
+                        batch.append((source_name, i, None))  # Bir önceki tespit kullanılacak
+                        continue
+                    last_signature = signature
+                batch.append((source_name, i, frame))
+                n_new += 1
+            timer.add("batch", time.perf_counter() - t0)
+            if not batch:
+                break
+
+            # 2. Tespit
+            t1 = time.perf_counter()
+            to_infer = [frame for _, _, frame in batch if frame is not None]
+            results = iter(model.predict(to_infer, device="cpu", imgsz=imgsz, conf=conf, verbose=False)) if to_infer else iter(())
+            timer.add("inference", time.perf_counter() - t1)
+
+            # 3. Yazma
+            t2 = time.perf_counter()
+            for source_name, i, frame in batch:
+                skipped = frame is None
+                if not skipped:
+                    last_detections = _boxes_to_dicts(next(results))
+                    n_inferred += 1
+                out.write(json.dumps({
+                    "source": source_name, "frame": i, "skipped": skipped, "detections": last_detections
+                }) + "\n")
+                n_frames += 1
+            timer.add("write", time.perf_counter() - t2)
+
+    producer.join()
+    elapsed = time.perf_counter() - start_total
+    return {
+        "kare_sayisi": n_frames,
+        "modele_verilen": n_inferred,
+        "toplam_sn": elapsed,
+        "fps": n_frames / elapsed if elapsed else 0.0,
+        "asama_sn": timer.totals,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="YOLO plaka tespiti (CPU, toplu)")
+    parser.add_argument("source", help="Görüntü klasörü, tek görüntü veya video dosyası")
+    parser.add_argument("--output", default="tespitler.jsonl")
+    parser.add_argument("--weights", default=WEIGHTS_PATH)
+    parser.add_argument("--batch", type=int, default=8)
+    parser.add_argument("--imgsz", type=int, default=640)
+    parser.add_argument("--conf", type=float, default=0.25)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--dedup-threshold", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print("🚗 Plaka Tespiti - Toplu Tespit")
+    print("=" * 50)
+    sonuc = detect(args.source, args.output, args.weights, args.batch, args.imgsz, args.conf,
+                   args.workers, args.dedup_threshold)
+
+    print(f"✅ {sonuc['kare_sayisi']:,} kare işlendi ({sonuc['modele_verilen']:,} tanesi modele verildi)")
+    print(f"⚡ {sonuc['fps']:.1f} kare/sn ({sonuc['toplam_sn']:.1f} sn)")
+    print(f"⏱️ Aşama süreleri:")
+    for stage, seconds in sonuc['asama_sn'].items():
+        print(f"   {stage:10s}: {seconds:.2f} sn")
+    print(f"💾 Tespitler '{args.output}' dosyasına yazıldı")
@@ -0,0 +1,196 @@
+# Plaka Tespiti - Görüntü Önbellekleme
+# Notebook'taki eğitimde her epoch tüm görüntüler cv2.imread ile yeniden okunuyordu.
+# Bu script dataset/images altındaki görüntüleri bir kez okuyup 640x640 letterbox
+# formatına getirir ve bellek eşlemeli (memory-mapped) uint8 bir diziye yazar.
+# Etiketler letterbox koordinatlarına çevrilip yanına kaydedilir.
+# Çalıştırıldığında önbellekli yükleyici ile düz cv2.imread yolunun hızı karşılaştırılır.
+
+import json
+import os
+import time
+from multiprocessing import Pool
+
+import cv2
+import numpy as np
+import torch
+import yaml
+from torch.utils.data import DataLoader, Dataset
+
+IMG_SIZE = 640
+CACHE_DIR = "cache"
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+PAD_COLOR = (114, 114, 114)  # Ultralytics ile aynı dolgu rengi
+
+def dataset_dirs(data_yaml="data.yaml"):
+    """data.yaml içinden görüntü ve etiket klasörlerini bulur"""
+    with open(data_yaml, encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+    root = data["path"]
+    if not os.path.isdir(root):
+        # data.yaml başka bir makinedeki mutlak yolu içerebilir => yerel dataset klasörü
+        root = os.path.join(os.path.dirname(os.path.abspath(data_yaml)), "dataset")
+    images_dir = os.path.join(root, data["train"])
+    labels_dir = os.path.join(root, "labels")  # YOLO: images -> labels
+    return images_dir, labels_dir
+
+def letterbox(img, size=IMG_SIZE):
+    """En-boy oranını koruyarak yeniden boyutlandırır ve kenarları doldurur"""
+    h, w = img.shape[:2]
+    r = min(size / h, size / w)
+    new_w, new_h = round(w * r), round(h * r)
+    pad_x, pad_y = (size - new_w) // 2, (size - new_h) // 2
+    out = np.full((size, size, 3), PAD_COLOR, dtype=np.uint8)
+    if (new_w, new_h) != (w, h):
+        img = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+    out[pad_y:pad_y + new_h, pad_x:pad_x + new_w] = img
+    return out, r, pad_x, pad_y
+
+def read_labels(label_path, w, h, r, pad_x, pad_y, size=IMG_SIZE):
+    """YOLO etiketlerini (cls, x, y, w, h normalize) letterbox koordinatlarına çevirir"""
+    if not os.path.exists(label_path):
+        return np.zeros((0, 5), dtype=np.float32)
+    labels = np.loadtxt(label_path, dtype=np.float32, ndmin=2)
+    if labels.size == 0:
+        return np.zeros((0, 5), dtype=np.float32)
+    labels[:, 1] = (labels[:, 1] * w * r + pad_x) / size
+    labels[:, 2] = (labels[:, 2] * h * r + pad_y) / size
+    labels[:, 3] = labels[:, 3] * w * r / size
+    labels[:, 4] = labels[:, 4] * h * r / size
+    return labels
+
+def _cache_one(args):
+    # İşçi süreçte çalışır: görüntüyü okuyup önbellek dosyasındaki kendi satırına yazar
+    i, image_path, label_path, cache_path, n_images, size = args
+    img = cv2.imread(image_path)
+    if img is None:
+        return i, None
+    h, w = img.shape[:2]
+    boxed, r, pad_x, pad_y = letterbox(img, size)
+    images = np.memmap(cache_path, dtype=np.uint8, mode="r+", shape=(n_images, size, size, 3))
+    images[i] = boxed
+    images.flush()
+    return i, read_labels(label_path, w, h, r, pad_x, pad_y, size)
+
+def build_cache(data_yaml="data.yaml", cache_dir=CACHE_DIR, size=IMG_SIZE, workers=None):
+    """
+    Tüm görüntüleri letterbox'layıp bellek eşlemeli önbelleğe yazar
+
+    Oluşan dosyalar:
+    - images_<size>.u8: (N, size, size, 3) uint8 BGR görüntüler
+    - labels_<size>.npz: etiketler (görüntü indeksine göre offsets ile)
+    - meta_<size>.json: dizi şekli ve dosya listesi
+    """
+    images_dir, labels_dir = dataset_dirs(data_yaml)
+    files = sorted(f for f in os.listdir(images_dir) if f.lower().endswith(IMAGE_EXTENSIONS))
+    n_images = len(files)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_path = os.path.join(cache_dir, f"images_{size}.u8")
+    np.memmap(cache_path, dtype=np.uint8, mode="w+", shape=(n_images, size, size, 3)).flush()
+
+    jobs = [
+        (i, os.path.join(images_dir, f), os.path.join(labels_dir, os.path.splitext(f)[0] + ".txt"),
+         cache_path, n_images, size)
+        for i, f in enumerate(files)
+    ]
+    labels = [None] * n_images
+    start = time.perf_counter()
+    with Pool(workers) as pool:
+        for i, lbl in pool.imap_unordered(_cache_one, jobs, chunksize=16):
+            labels[i] = lbl
+    elapsed = time.perf_counter() - start
+
+    bad = [files[i] for i, lbl in enumerate(labels) if lbl is None]
+    labels = [np.zeros((0, 5), dtype=np.float32) if lbl is None else lbl for lbl in labels]
+    offsets = np.concatenate([[0], np.cumsum([len(lbl) for lbl in labels])])
+    np.savez(os.path.join(cache_dir, f"labels_{size}.npz"),
+             labels=np.concatenate(labels) if labels else np.zeros((0, 5), dtype=np.float32),
+             offsets=offsets)
+    with open(os.path.join(cache_dir, f"meta_{size}.json"), 'w', encoding='utf-8') as f:
+        json.dump({"shape": [n_images, size, size, 3], "files": files, "unreadable": bad}, f)
+
+    print(f"✅ {n_images:,} görüntü {elapsed:.1f} sn içinde önbelleğe alındı ({n_images / elapsed:,.0f} görüntü/sn)")
+    if bad:
+        print(f"⚠️ Okunamayan görüntüler: {len(bad)}")
+    return cache_path
+
+class CachedPlateDataset(Dataset):
+    """Bellek eşlemeli önbellekten (görüntü, etiket) döndüren PyTorch dataset'i"""
+
+    def __init__(self, cache_dir=CACHE_DIR, size=IMG_SIZE):
+        with open(os.path.join(cache_dir, f"meta_{size}.json"), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.cache_path = os.path.join(cache_dir, f"images_{size}.u8")
+        self.shape = tuple(self.meta["shape"])
+        data = np.load(os.path.join(cache_dir, f"labels_{size}.npz"))
+        self.labels, self.offsets = data["labels"], data["offsets"]
+        self.images = None  # Her işçi süreçte ilk erişimde açılır
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, i):
+        if self.images is None:
+            self.images = np.memmap(self.cache_path, dtype=np.uint8, mode="r", shape=self.shape)
+        img = torch.from_numpy(np.ascontiguousarray(self.images[i][:, :, ::-1].transpose(2, 0, 1)))  # BGR->RGB, HWC->CHW
+        labels = torch.from_numpy(self.labels[self.offsets[i]:self.offsets[i + 1]])
+        return img, labels
+
+def collate(batch):
+    """Görüntüleri birleştirir, etiketlere batch içi görüntü indeksini ekler"""
+    images = torch.stack([img for img, _ in batch])
+    labels = torch.cat([
+        torch.cat([torch.full((len(lbl), 1), i, dtype=lbl.dtype), lbl], dim=1)
+        for i, (_, lbl) in enumerate(batch)
+    ])
+    return images, labels
+
+def make_loader(cache_dir=CACHE_DIR, batch_size=8, workers=4, shuffle=True):
+    """Önbellekten çok süreçli DataLoader oluşturur"""
+    return DataLoader(
+        CachedPlateDataset(cache_dir), batch_size=batch_size, shuffle=shuffle,
+        num_workers=workers, collate_fn=collate, persistent_workers=workers > 0,
+    )
+
+class PlainPlateDataset(Dataset):
+    """Karşılaştırma için: her erişimde cv2.imread + letterbox yapan düz yol"""
+
+    def __init__(self, data_yaml="data.yaml", size=IMG_SIZE):
+        images_dir, _ = dataset_dirs(data_yaml)
+        self.paths = sorted(os.path.join(images_dir, f) for f in os.listdir(images_dir)
+                            if f.lower().endswith(IMAGE_EXTENSIONS))
+        self.size = size
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __getitem__(self, i):
+        img, _, _, _ = letterbox(cv2.imread(self.paths[i]), self.size)
+        return torch.from_numpy(np.ascontiguousarray(img[:, :, ::-1].transpose(2, 0, 1))), torch.zeros((0, 5))
+
+def measure(loader, epochs=1):
+    """Yükleyicinin saniyede teslim ettiği görüntü sayısını ölçer"""
+    n_images = 0
+    start = time.perf_counter()
+    for _ in range(epochs):
+        for images, _ in loader:
+            n_images += len(images)
+    return n_images / (time.perf_counter() - start)
+
+if __name__ == "__main__":
+    print("🚗 Plaka Tespiti - Görüntü Önbellekleme")
+    print("=" * 50)
+
+    if not os.path.exists(os.path.join(CACHE_DIR, f"meta_{IMG_SIZE}.json")):
+        build_cache()
+
+    workers = min(8, os.cpu_count() or 1)
+    plain = DataLoader(PlainPlateDataset(), batch_size=8, num_workers=workers, collate_fn=collate)
+    cached = make_loader(batch_size=8, workers=workers)
+
+    plain_rate = measure(plain)
+    cached_rate = measure(cached)
+    print(f"\n⚡ YÜKLEYİCİ HIZI ({workers} işçi, batch=8):")
+    print(f"   cv2.imread yolu:   {plain_rate:,.0f} görüntü/sn")
+    print(f"   Önbellekli yol:    {cached_rate:,.0f} görüntü/sn")
+    print(f"   Hızlanma:          {cached_rate / plain_rate:.1f}x")
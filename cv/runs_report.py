@@ -0,0 +1,137 @@
+# Plaka Tespiti - Eğitim Koşuları Analizi
+# runs/detect/train* klasörlerindeki results.csv ve args.yaml dosyalarını tek bir
+# sütunlu (Parquet) tabloda toplar. Her koşu için mAP değerleri ile epoch süresini
+# imgsz, batch, workers gibi ayarlarla birlikte raporlar. İndeks artımlı güncellenir:
+# yalnızca yeni veya değişmiş koşular yeniden okunur.
+#
+# Kullanım:
+#   python runs_report.py              => tüm koşuları özetler
+#   python runs_report.py --target 0.7 => mAP50-95 >= 0.7 olan en ucuz ayarı bulur
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+import yaml
+
+RUNS_DIR = os.path.join("runs", "detect")
+INDEX_PATH = os.path.join("runs", "runs_index.parquet")
+
+# Throughput ve doğruluğu etkileyen ayarlar
+ARG_COLUMNS = ["model", "imgsz", "batch", "workers", "epochs", "device", "cache", "optimizer", "amp", "rect"]
+
+METRIC_COLUMNS = {
+    "metrics/precision(B)": "precision",
+    "metrics/recall(B)": "recall",
+    "metrics/mAP50(B)": "map50",
+    "metrics/mAP50-95(B)": "map50_95",
+}
+
+def _mtime(path):
+    return os.path.getmtime(path) if os.path.exists(path) else 0.0
+
+def parse_run(run_dir):
+    """Tek bir koşunun epoch bazlı metriklerini ve ayarlarını DataFrame olarak döner"""
+    args_path = os.path.join(run_dir, "args.yaml")
+    results_path = os.path.join(run_dir, "results.csv")
+
+    with open(args_path, encoding='utf-8') as f:
+        args = yaml.safe_load(f) or {}
+
+    if os.path.exists(results_path):
+        results = pd.read_csv(results_path)
+        results.columns = results.columns.str.strip()  # Eski sürümlerde başlıklarda boşluk olabilir
+        df = results[["epoch", "time"] + [c for c in METRIC_COLUMNS if c in results.columns]].copy()
+        df = df.rename(columns=METRIC_COLUMNS)
+        # time sütunu kümülatif saniyedir => epoch süresi farktan bulunur
+        df["epoch_time"] = df["time"].diff().fillna(df["time"])
+    else:
+        # Yarıda kalmış koşu: metrik yok ama ayarları tabloda görünsün
+        df = pd.DataFrame({"epoch": [np.nan], "time": [np.nan], "epoch_time": [np.nan]})
+
+    for col in METRIC_COLUMNS.values():
+        if col not in df.columns:
+            df[col] = np.nan
+
+    df.insert(0, "run", os.path.basename(run_dir))
+    for col in ARG_COLUMNS:
+        value = args.get(col)
+        df[col] = np.nan if value is None else (value if isinstance(value, (int, float)) and not isinstance(value, bool) else str(value))
+    df["args_mtime"] = _mtime(args_path)
+    df["results_mtime"] = _mtime(results_path)
+    return df
+
+def update_index(runs_dir=RUNS_DIR, index_path=INDEX_PATH):
+    """İndeksi günceller: yeni/değişmiş koşuları okur, silinen koşuları çıkarır"""
+    index = pd.read_parquet(index_path) if os.path.exists(index_path) else None
+
+    run_dirs = sorted(
+        os.path.join(runs_dir, d) for d in os.listdir(runs_dir)
+        if os.path.exists(os.path.join(runs_dir, d, "args.yaml"))
+    )
+
+    frames = []
+    n_parsed = 0
+    for run_dir in run_dirs:
+        run = os.path.basename(run_dir)
+        if index is not None:
+            cached = index[index["run"] == run]
+            if (len(cached)
+                    and cached["args_mtime"].iloc[0] == _mtime(os.path.join(run_dir, "args.yaml"))
+                    and cached["results_mtime"].iloc[0] == _mtime(os.path.join(run_dir, "results.csv"))):
+                frames.append(cached)
+                continue
+        frames.append(parse_run(run_dir))
+        n_parsed += 1
+
+    index = pd.concat(frames, ignore_index=True)
+    for col in ARG_COLUMNS:
+        # Parquet karışık tipli sütun kabul etmez
+        if index[col].dtype == object:
+            index[col] = index[col].astype("string")
+    index.to_parquet(index_path, index=False)
+    print(f"📦 {len(run_dirs)} koşu indekslendi ({n_parsed} tanesi yeniden okundu)")
+    return index
+
+def summarize(index):
+    """Koşu başına son mAP değerleri ve ortalama epoch süresi"""
+    last = index.sort_values("epoch").groupby("run").tail(1).set_index("run")
+    summary = pd.DataFrame({
+        "map50": last["map50"],
+        "map50_95": last["map50_95"],
+        "epochs_done": index.groupby("run")["epoch"].max(),
+        "mean_epoch_sn": index.groupby("run")["epoch_time"].mean(),
+        "toplam_sn": last["time"],
+    })
+    summary = summary.join(last[ARG_COLUMNS])
+    return summary.sort_values("mean_epoch_sn")
+
+def cheapest_config(summary, target, metric="map50_95"):
+    """Hedef doğruluğu sağlayan en kısa epoch süreli koşuyu döner"""
+    ok = summary[summary[metric] >= target].dropna(subset=["mean_epoch_sn"])
+    if ok.empty:
+        return None
+    return ok.sort_values("mean_epoch_sn").iloc[0]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="YOLO eğitim koşularını karşılaştırır")
+    parser.add_argument("--target", type=float, default=None, help="Hedef doğruluk değeri")
+    parser.add_argument("--metric", default="map50_95", choices=["map50", "map50_95"])
+    args = parser.parse_args()
+
+    print("📊 Plaka Tespiti - Eğitim Koşuları Analizi")
+    print("=" * 60)
+
+    summary = summarize(update_index())
+    with pd.option_context("display.width", 160, "display.max_columns", None):
+        print(summary.round(4))
+
+    if args.target is not None:
+        best = cheapest_config(summary, args.target, args.metric)
+        if best is None:
+            print(f"\n❌ {args.metric} >= {args.target} sağlayan koşu yok")
+        else:
+            print(f"\n🎯 {args.metric} >= {args.target} sağlayan en ucuz koşu: {best.name}")
+            print(f"   imgsz={best['imgsz']}, batch={best['batch']}, workers={best['workers']}, "
+                  f"epoch süresi={best['mean_epoch_sn']:.1f} sn, {args.metric}={best[args.metric]:.4f}")
@@ -0,0 +1,142 @@
+# Spam Sınıflandırıcı - Hashing Vectorizer Modu
+# TfidfVectorizer tüm kelime dağarcığını (vocabulary) bellekte tutar ve bütün veriyi
+# baştan ister. Bu modda kelimeler sabit boyutlu bir özellik uzayına hash'lenir,
+# IDF ağırlıkları akış sırasında güncellenir ve MultinomialNB.partial_fit ile
+# parça parça eğitim yapılır. Bellek kullanımı veri büyüdükçe artmaz.
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.preprocessing import normalize
+
+from preprocessing import clean_text, clean_texts
+
+MODEL_PATH = "spam_hashing_modeli.pkl"
+N_FEATURES = 2 ** 20
+CLASSES = np.array([0, 1])  # 0 => ham, 1 => spam
+
+def create_vectorizer(n_features=N_FEATURES):
+    """Durumsuz (stateless) hashing vectorizer oluşturur"""
+    # MultinomialNB negatif değer kabul etmez => alternate_sign=False
+    # Normalizasyon IDF ağırlığından sonra yapılır => norm=None
+    return HashingVectorizer(n_features=n_features, alternate_sign=False, norm=None)
+
+class StreamingIdf:
+    """Doküman frekanslarını akış sırasında biriktirip IDF ağırlıklarını hesaplar"""
+
+    def __init__(self, n_features=N_FEATURES):
+        self.doc_freq = np.zeros(n_features, dtype=np.int64)
+        self.n_docs = 0
+
+    def to_state(self):
+        """Pickle için sade veri (sınıf referansı içermez, her modülden yüklenebilir)"""
+        return {'doc_freq': self.doc_freq, 'n_docs': self.n_docs}
+
+    @classmethod
+    def from_state(cls, state):
+        """to_state çıktısından IDF nesnesini yeniden oluşturur"""
+        idf = cls(n_features=len(state['doc_freq']))
+        idf.doc_freq = np.asarray(state['doc_freq'], dtype=np.int64)
+        idf.n_docs = state['n_docs']
+        return idf
+
+    def partial_fit(self, X):
+        """Yeni parçanın doküman frekanslarını ekler"""
+        self.doc_freq += np.bincount(X.indices, minlength=self.doc_freq.shape[0])
+        self.n_docs += X.shape[0]
+        return self
+
+    @property
+    def idf(self):
+        # TfidfVectorizer ile aynı formül (smooth_idf=True)
+        return np.log((1 + self.n_docs) / (1 + self.doc_freq)) + 1.0
+
+    def transform(self, X):
+        """Terim sayılarını IDF ile ağırlıklandırıp L2 normalize eder"""
+        return normalize(X.multiply(self.idf).tocsr())
+
+def vectorize(vectorizer, idf, clean_docs):
+    """Temizlenmiş dokümanları seyrek özellik matrisine çevirir"""
+    X = vectorizer.transform(clean_docs)
+    if idf is None:
+        return normalize(X)
+    return idf.transform(X)
+
+def train_streaming(path="spam_ham_dataset.csv", chunk_size=10000, use_idf=True, n_jobs=None):
+    """
+    CSV dosyasını parça parça okuyarak modeli eğitir
+
+    - **use_idf**: True => IDF akış sırasında güncellenir, False => yalnızca terim frekansı
+    - **n_jobs**: Temizleme için süreç sayısı (havuz tüm parçalar boyunca tekrar kullanılır)
+
+    Bellek sabit kalsın diye doküman önbelleği kullanılmaz, yalnızca o anki parça bellekte tutulur.
+    """
+    vectorizer = create_vectorizer()
+    idf = StreamingIdf() if use_idf else None
+    model = MultinomialNB()
+
+    n_docs = 0
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        for chunk in pd.read_csv(path, usecols=['text', 'label_num'], chunksize=chunk_size):
+            clean_docs = clean_texts(chunk['text'], executor=executor)
+            counts = vectorizer.transform(clean_docs)
+            if idf is not None:
+                # Parça, IDF'e eklendikten sonra güncel ağırlıklarla vektörlenir
+                idf.partial_fit(counts)
+                X = idf.transform(counts)
+            else:
+                X = normalize(counts)
+            model.partial_fit(X, chunk['label_num'].values, classes=CLASSES)
+            n_docs += len(chunk)
+            print(f"   ⏳ {n_docs:,} doküman işlendi")
+
+    return {
+        'cleaner': clean_text,
+        'vectorizer': vectorizer,
+        'idf': idf,
+        'model': model,
+        'n_documents': n_docs,
+    }
+
+def save_model(model_data, path=MODEL_PATH):
+    """Vectorizer, IDF ve modeli tek dosyada kaydeder"""
+    # Bu dosya script olarak çalıştığında StreamingIdf '__main__.StreamingIdf' olarak
+    # pickle'lanır ve başka modüllerden yüklenemez => IDF sade veri olarak saklanır
+    idf = model_data.get('idf')
+    if isinstance(idf, StreamingIdf):
+        model_data = {**model_data, 'idf': idf.to_state()}
+    with open(path, 'wb') as f:
+        pickle.dump(model_data, f)
+    print(f"💾 Model '{path}' olarak kaydedildi!")
+
+def load_model(path=MODEL_PATH):
+    """Kaydedilmiş modeli yükler (hashing ve TF-IDF pipeline dosyaları için)"""
+    with open(path, 'rb') as f:
+        model_data = pickle.load(f)
+    if isinstance(model_data.get('idf'), dict):
+        model_data['idf'] = StreamingIdf.from_state(model_data['idf'])
+    return model_data
+
+def predict_texts(model_data, texts):
+    """Yeni mailleri kelime dağarcığı gerekmeden sınıflandırır"""
+    X = vectorize(model_data['vectorizer'], model_data['idf'], clean_texts(texts))
+    return model_data['model'].predict(X)
+
+if __name__ == "__main__":
+    print("✉️ Spam Sınıflandırıcı - Hashing Modu")
+    print("=" * 50)
+
+    model_data = train_streaming()
+    save_model(model_data)
+
+    model_data = load_model()
+    ornekler = [
+        "Congratulations! You won a free cruise, call now to claim your prize",
+        "Please find attached the meeting notes from yesterday",
+    ]
+    for text, label in zip(ornekler, predict_texts(model_data, ornekler)):
+        print(f"{'🚫 SPAM' if label == 1 else '✅ HAM '} | {text}")
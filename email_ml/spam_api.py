@@ -0,0 +1,228 @@
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel, ConfigDict
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import List
+import time
+
+from hashing_model import load_model as load_pipeline, vectorize
+from preprocessing import clean_text, text_hash
+
+MODEL_PATH = "spam_modeli.pkl"
+CACHE_SIZE = 100000  # Önbellekte tutulacak en fazla mesaj sayısı
+MAX_BATCH_SIZE = 10000
+
+# Global değişkenler
+model_data = None
+result_cache = OrderedDict()  # mesaj özeti -> (etiket, spam olasılığı)
+cache_stats = {"hit": 0, "miss": 0}
+
+# Model yükleme fonksiyonu
+def load_model(path=MODEL_PATH):
+    global model_data
+    try:
+        model_data = load_pipeline(path)
+        print("✅ Spam modeli başarıyla yüklendi!")
+        return True
+    except Exception as e:
+        print(f"❌ Model yüklenirken hata: {e}")
+        return False
+
+def score_messages(messages):
+    """
+    Mesaj listesini tek seferde puanlar
+
+    Önbellekte olan mesajlar atlanır, kalanlar tek bir seyrek matris halinde
+    vektörleştirilip modele verilir. Dönüş: (sonuçlar, aşama süreleri ms)
+    """
+    timings = {}
+    t0 = time.perf_counter()
+
+    # 1. Önbellek kontrolü (aynı batch içindeki tekrarlar da bir kez puanlanır)
+    keys = [text_hash(m) for m in messages]
+    todo = {}
+    for key, message in zip(keys, messages):
+        if key in result_cache:
+            result_cache.move_to_end(key)
+            cache_stats["hit"] += 1
+        elif key in todo:
+            # Aynı batch içindeki tekrar: model yalnızca ilkini puanlar
+            cache_stats["hit"] += 1
+        else:
+            todo[key] = message
+            cache_stats["miss"] += 1
+    t1 = time.perf_counter()
+    timings["onbellek_ms"] = (t1 - t0) * 1000
+
+    if todo:
+        # 2. Temizleme
+        cleaner = model_data.get('cleaner', clean_text)
+        clean_docs = [cleaner(m) for m in todo.values()]
+        t2 = time.perf_counter()
+
+        # 3. Vektörleştirme
+        X = vectorize(model_data['vectorizer'], model_data.get('idf'), clean_docs)
+        t3 = time.perf_counter()
+
+        # 4. Tahmin
+        spam_proba = model_data['model'].predict_proba(X)[:, 1]
+        t4 = time.perf_counter()
+
+        for key, proba in zip(todo.keys(), spam_proba):
+            result_cache[key] = (int(proba >= 0.5), float(proba))
+        while len(result_cache) > CACHE_SIZE:
+            result_cache.popitem(last=False)
+
+        timings["temizleme_ms"] = (t2 - t1) * 1000
+        timings["vektorlestirme_ms"] = (t3 - t2) * 1000
+        timings["tahmin_ms"] = (t4 - t3) * 1000
+    else:
+        timings["temizleme_ms"] = timings["vektorlestirme_ms"] = timings["tahmin_ms"] = 0.0
+
+    results = [result_cache[key] for key in keys]
+    timings["toplam_ms"] = (time.perf_counter() - t0) * 1000
+    timings = {stage: round(ms, 3) for stage, ms in timings.items()}
+    return results, timings
+
+# Uygulama yaşam döngüsü yönetimi
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup
+    if not load_model():
+        raise Exception("Model yüklenemedi!")
+    yield
+
+# FastAPI uygulaması oluşturma
+app = FastAPI(
+    title="Spam Mail Tespit API",
+    description="TF-IDF + Multinomial Naive Bayes ile mailleri spam/ham olarak sınıflandıran API",
+    version="1.0.0",
+    lifespan=lifespan
+)
+
+# Tek mesaj isteği için veri modeli
+class SpamTahminRequest(BaseModel):
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "mesaj": "Congratulations! You won a free cruise, call now to claim your prize"
+            }
+        }
+    )
+
+    mesaj: str
+
+# Toplu istek için veri modeli
+class SpamBatchRequest(BaseModel):
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "mesajlar": [
+                    "Congratulations! You won a free cruise, call now to claim your prize",
+                    "Please find attached the meeting notes from yesterday"
+                ]
+            }
+        }
+    )
+
+    mesajlar: List[str]
+
+# Tek mesaj sonucu için veri modeli
+class SpamTahminResponse(BaseModel):
+    spam: bool
+    spam_olasiligi: float
+    sure_ms: dict
+
+# Toplu tahmin sonucu için veri modeli
+class SpamBatchResponse(BaseModel):
+    sonuclar: List[dict]
+    mesaj_sayisi: int
+    sure_ms: dict
+
+@app.get("/", summary="Ana Sayfa")
+async def root():
+    """API ana sayfası - API hakkında genel bilgi"""
+    return {
+        "mesaj": "✉️ Spam Mail Tespit API'sine Hoş Geldiniz!",
+        "endpoints": {
+            "/predict": "POST - Tek mesaj puanlayın",
+            "/predict/batch": "POST - Toplu mesaj puanlayın",
+            "/metrics": "GET - Model ve önbellek metriklerini görün",
+            "/docs": "GET - API dokümantasyonu"
+        },
+        "model_durumu": "Aktif" if model_data else "Pasif"
+    }
+
+@app.post("/predict", response_model=SpamTahminResponse, summary="Spam Tahmini")
+async def predict(istek: SpamTahminRequest):
+    """Tek bir mesajın spam olup olmadığını tahmin eder"""
+
+    if not model_data:
+        raise HTTPException(status_code=500, detail="Model yüklenmemiş!")
+
+    try:
+        [(label, proba)], timings = score_messages([istek.mesaj])
+        return SpamTahminResponse(spam=bool(label), spam_olasiligi=round(proba, 4), sure_ms=timings)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Tahmin yapılırken hata: {str(e)}")
+
+@app.post("/predict/batch", response_model=SpamBatchResponse, summary="Toplu Spam Tahmini")
+async def predict_batch(istek: SpamBatchRequest):
+    """
+    Mesaj listesini tek seferde puanlar
+
+    - **mesajlar**: Puanlanacak mesajlar (en fazla 10.000)
+
+    Daha önce puanlanmış mesajlar önbellekten döner. Yanıtta her aşamanın
+    (önbellek, temizleme, vektörleştirme, tahmin) süresi milisaniye olarak yer alır.
+    """
+
+    if not model_data:
+        raise HTTPException(status_code=500, detail="Model yüklenmemiş!")
+
+    if len(istek.mesajlar) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"Tek istekte en fazla {MAX_BATCH_SIZE} mesaj gönderilebilir")
+
+    try:
+        results, timings = score_messages(istek.mesajlar)
+        return SpamBatchResponse(
+            sonuclar=[{"spam": bool(label), "spam_olasiligi": round(proba, 4)} for label, proba in results],
+            mesaj_sayisi=len(results),
+            sure_ms=timings
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Tahmin yapılırken hata: {str(e)}")
+
+@app.get("/metrics", summary="Model ve Önbellek Metrikleri")
+async def get_metrics():
+    """Modelin test metriklerini ve önbellek isabet oranını döner"""
+
+    if not model_data:
+        raise HTTPException(status_code=500, detail="Model yüklenmemiş!")
+
+    total = cache_stats["hit"] + cache_stats["miss"]
+    return {
+        "algoritma": "Multinomial Naive Bayes",
+        "vektorlestirici": type(model_data['vectorizer']).__name__,
+        "model_metrikleri": {k: round(v, 4) for k, v in model_data.get('metrics', {}).items()},
+        "onbellek": {
+            "kayit_sayisi": len(result_cache),
+            "isabet": cache_stats["hit"],
+            "iskalama": cache_stats["miss"],
+            "isabet_orani": round(cache_stats["hit"] / total, 4) if total else 0.0
+        }
+    }
+
+@app.get("/health", summary="Sağlık Kontrolü")
+async def health_check():
+    """API'nin sağlığını kontrol eder"""
+    return {
+        "durum": "Sağlıklı",
+        "model_durumu": "Yüklü" if model_data else "Yüklenmemiş",
+        "api_versiyonu": "1.0.0"
+    }
+
+if __name__ == "__main__":
+    print("🚀 Spam Mail Tespit API başlatılıyor...")
+    import subprocess
+    subprocess.run(["uvicorn", "spam_api:app", "--host", "127.0.0.1", "--port", "8001", "--reload"])
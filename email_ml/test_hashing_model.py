@@ -0,0 +1,41 @@
+import pickle
+
+import pandas as pd
+import pytest
+
+import hashing_model
+
+SPAM = "Congratulations! You won a free cruise, call now to claim your prize"
+HAM = "Please find attached the meeting notes from yesterday"
+
+@pytest.fixture
+def dataset(tmp_path):
+    """spam_ham_dataset.csv ile aynı sütunlara sahip küçük bir CSV"""
+    path = tmp_path / "spam_ham_dataset.csv"
+    pd.DataFrame({
+        'text': [SPAM, "Win a free prize now, claim your cash reward",
+                 HAM, "The project meeting is moved to Monday afternoon"] * 3,
+        'label_num': [1, 1, 0, 0] * 3,
+    }).to_csv(path, index=False)
+    return path
+
+def test_save_load_predict_round_trip(dataset, tmp_path):
+    model_data = hashing_model.train_streaming(dataset, chunk_size=5, n_jobs=1)
+    expected = hashing_model.predict_texts(model_data, [SPAM, HAM])
+
+    model_path = tmp_path / "spam_hashing_modeli.pkl"
+    hashing_model.save_model(model_data, model_path)
+
+    # IDF sade veri olarak saklanır => dosya StreamingIdf sınıfına referans içermez
+    with open(model_path, 'rb') as f:
+        raw = pickle.load(f)
+    assert isinstance(raw['idf'], dict)
+    assert raw['idf']['n_docs'] == 12
+
+    loaded = hashing_model.load_model(model_path)
+    assert isinstance(loaded['idf'], hashing_model.StreamingIdf)
+    assert (loaded['idf'].doc_freq == model_data['idf'].doc_freq).all()
+    assert list(hashing_model.predict_texts(loaded, [SPAM, HAM])) == list(expected) == [1, 0]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
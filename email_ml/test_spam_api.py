@@ -0,0 +1,94 @@
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.naive_bayes import MultinomialNB
+
+import hashing_model
+import spam_api
+from preprocessing import clean_text
+
+SPAM = "Congratulations! You won a free cruise, call now to claim your prize"
+HAM = "Please find attached the meeting notes from yesterday"
+
+@pytest.fixture
+def client():
+    """Küçük bir TF-IDF + MultinomialNB pipeline'ı ile API istemcisi"""
+    texts = [SPAM, "Win a free prize now, claim your cash reward",
+             HAM, "The project meeting is moved to Monday afternoon"]
+    labels = [1, 1, 0, 0]
+    tfidf = TfidfVectorizer()
+    X = tfidf.fit_transform([clean_text(t) for t in texts])
+
+    spam_api.model_data = {
+        'cleaner': clean_text,
+        'vectorizer': tfidf,
+        'idf': None,
+        'model': MultinomialNB().fit(X, labels),
+        'metrics': {'test_accuracy': 1.0},
+    }
+    spam_api.result_cache.clear()
+    spam_api.cache_stats.update(hit=0, miss=0)
+    # Lifespan çalıştırılmaz (model dosyası gerekmez), model yukarıda yüklendi
+    yield TestClient(spam_api.app)
+    spam_api.model_data = None
+
+def test_health(client):
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json()["model_durumu"] == "Yüklü"
+
+def test_predict_single(client):
+    response = client.post("/predict", json={"mesaj": SPAM})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["spam"] is True
+    assert 0.5 <= data["spam_olasiligi"] <= 1.0
+    assert {"onbellek_ms", "temizleme_ms", "vektorlestirme_ms", "tahmin_ms", "toplam_ms"} <= set(data["sure_ms"])
+
+def test_predict_batch_keeps_order(client):
+    response = client.post("/predict/batch", json={"mesajlar": [HAM, SPAM, HAM]})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["mesaj_sayisi"] == 3
+    assert [r["spam"] for r in data["sonuclar"]] == [False, True, False]
+
+def test_cache_hit_rate_counts_in_batch_duplicates(client):
+    client.post("/predict/batch", json={"mesajlar": [SPAM, SPAM, HAM]})  # 1 isabet, 2 ıskalama
+    client.post("/predict", json={"mesaj": HAM})  # 1 isabet
+
+    onbellek = client.get("/metrics").json()["onbellek"]
+    assert onbellek["isabet"] == 2
+    assert onbellek["iskalama"] == 2
+    assert onbellek["isabet_orani"] == 0.5
+    assert onbellek["kayit_sayisi"] == 2
+
+def test_batch_size_limit(client):
+    response = client.post("/predict/batch", json={"mesajlar": ["x"] * (spam_api.MAX_BATCH_SIZE + 1)})
+    assert response.status_code == 400
+
+def test_serves_saved_hashing_bundle(tmp_path):
+    """hashing_model.py'nin kaydettiği dosya API tarafından yüklenip puanlanabilmeli"""
+    dataset = tmp_path / "spam_ham_dataset.csv"
+    pd.DataFrame({
+        'text': [SPAM, "Win a free prize now, claim your cash reward",
+                 HAM, "The project meeting is moved to Monday afternoon"] * 3,
+        'label_num': [1, 1, 0, 0] * 3,
+    }).to_csv(dataset, index=False)
+    model_path = tmp_path / "spam_hashing_modeli.pkl"
+    hashing_model.save_model(hashing_model.train_streaming(dataset, chunk_size=5, n_jobs=1), model_path)
+
+    spam_api.result_cache.clear()
+    spam_api.cache_stats.update(hit=0, miss=0)
+    assert spam_api.load_model(model_path)
+    try:
+        client = TestClient(spam_api.app)
+        response = client.post("/predict/batch", json={"mesajlar": [SPAM, HAM]})
+        assert response.status_code == 200
+        assert [r["spam"] for r in response.json()["sonuclar"]] == [True, False]
+        assert client.get("/metrics").json()["vektorlestirici"] == "HashingVectorizer"
+    finally:
+        spam_api.model_data = None
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,69 @@
+# Spam Sınıflandırıcı - Model Eğitim Scripti
+# Notebook'taki TF-IDF + MultinomialNB modelini eğitir ve temizleyici, vectorizer ve
+# modeli tek bir pipeline dosyası olarak kaydeder. spam_api.py bu dosyayı kullanır.
+
+import pickle
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics import accuracy_score, classification_report, f1_score
+from sklearn.model_selection import train_test_split
+from sklearn.naive_bayes import MultinomialNB
+
+from preprocessing import clean_text, clean_texts, load_cache, save_cache
+
+MODEL_PATH = "spam_modeli.pkl"
+
+def main():
+    """Modeli eğitir ve pipeline dosyasını kaydeder"""
+    print("✉️ Spam Sınıflandırıcı - Model Eğitimi")
+    print("=" * 60)
+
+    # 1. VERİ YÜKLEME VE ÖN İŞLEME
+    print("\n📊 1. Veri Yükleniyor...")
+    df = pd.read_csv("spam_ham_dataset.csv")[['text', 'label_num']]
+    print(f"📋 Veri şekli: {df.shape}")
+
+    cache = load_cache()
+    df['clean_text'] = clean_texts(df['text'], cache=cache)
+    save_cache(cache)
+    print("✅ Metinler temizlendi!")
+
+    # 2. VEKTÖRLEŞTİRME VE BÖLME
+    print("\n🔢 2. Vektörleştirme...")
+    tfidf = TfidfVectorizer()
+    X_tfidf = tfidf.fit_transform(df['clean_text'])
+    y = df['label_num']
+    print(f"📊 Özellik matrisi şekli: {X_tfidf.shape}")
+
+    X_train, X_test, y_train, y_test = train_test_split(X_tfidf, y, test_size=0.3, random_state=42)
+
+    # 3. MODEL EĞİTİMİ
+    print("\n🧠 3. MultinomialNB Eğitiliyor...")
+    model = MultinomialNB()
+    model.fit(X_train, y_train)
+
+    y_pred = model.predict(X_test)
+    print(classification_report(y_test, y_pred))
+
+    # 4. PIPELINE KAYDETME
+    print("\n💾 4. Pipeline Kaydediliyor...")
+    model_data = {
+        'cleaner': clean_text,
+        'vectorizer': tfidf,
+        'idf': None,  # TfidfVectorizer IDF'i kendi içinde uygular
+        'model': model,
+        'metrics': {
+            'test_accuracy': accuracy_score(y_test, y_pred),
+            'test_f1': f1_score(y_test, y_pred),
+        }
+    }
+
+    with open(MODEL_PATH, 'wb') as f:
+        pickle.dump(model_data, f)
+
+    print(f"✅ Pipeline '{MODEL_PATH}' olarak kaydedildi!")
+
+# Windows/macOS'ta (spawn) işçi süreçler bu dosyayı yeniden import eder;
+# eğitim yalnızca doğrudan çalıştırıldığında başlamalı
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,21 @@ import numpy as np
 from typing import Optional
 import uvicorn
 from contextlib import asynccontextmanager
+from drift import DriftCollector
 
 # Global değişkenler
 model_data = None
+drift_collector = None
 
 # Model yükleme fonksiyonu
 def load_model():
-    global model_data
+    global model_data, drift_collector
     try:
         with open('ev_fiyat_tahmin_modeli.pkl', 'rb') as f:
             model_data = pickle.load(f)
+        # Eski model dosyalarında eğitim dağılımı yoksa drift takibi kapalı kalır
+        if 'training_stats' in model_data:
+            drift_collector = DriftCollector(model_data['training_stats'])
         print("✅ Model başarıyla yüklendi!")
         return True
     except Exception as e:
@@ -111,6 +116,7 @@ async def root():
         "endpoints": {
             "/predict": "POST - Ev fiyat tahmini yapın",
             "/metrics": "GET - Model performans metriklerini görün",
+            "/drift": "GET - Gelen isteklerin eğitim verisine göre dağılım kaymasını görün",
             "/docs": "GET - API dokümantasyonu"
         },
         "model_durumu": "Aktif" if model_data else "Pasif"
@@ -143,8 +149,14 @@ async def predict_price(ev_data: EvTahminRequest):
         raise HTTPException(status_code=500, detail="Model yüklenmemiş!")
     
     try:
+        girdi = ev_data.model_dump()
+
+        # Drift takibi için girdiyi özetlere ekleme (istek başına birkaç mikrosaniye)
+        if drift_collector:
+            drift_collector.update(girdi)
+
         # Giriş verilerini DataFrame'e çevirme
-        input_data = pd.DataFrame([ev_data.model_dump()])
+        input_data = pd.DataFrame([girdi])
         
         # Kategorik verileri encode etme
         for col, encoder in model_data['label_encoders'].items():
@@ -235,6 +247,29 @@ async def get_metrics():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Metrikler alınırken hata: {str(e)}")
 
+@app.get("/drift", summary="Girdi Dağılımı Kayma Raporu")
+async def get_drift():
+    """
+    /predict'e gelen isteklerin dağılımını eğitim verisiyle karşılaştırır
+
+    - Sayısal özellikler için PSI ve ortalama/standart sapma karşılaştırması
+    - Kategorik özellikler için PSI ve eğitimde görülmemiş değerler
+    - PSI < 0.1 stabil, 0.1-0.25 hafif kayma, > 0.25 ciddi kayma
+
+    Her API worker'ı kendi isteklerini sayar; rapor yalnızca yanıtı veren worker'a aittir.
+    """
+
+    if not model_data:
+        raise HTTPException(status_code=500, detail="Model yüklenmemiş!")
+
+    if not drift_collector:
+        raise HTTPException(
+            status_code=404,
+            detail="Model dosyasında eğitim dağılımı yok. Modeli main.py ile yeniden eğitin."
+        )
+
+    return drift_collector.report()
+
 @app.get("/health", summary="Sağlık Kontrolü")
 async def health_check():
     """API'nin sağlığını kontrol eder"""
@@ -0,0 +1,135 @@
+# Girdi Dağılımı İzleme (Drift)
+# /predict'e gelen isteklerin özelliklerini sabit bellekli özetlerde (sketch) toplar ve
+# main.py'de modelle birlikte kaydedilen eğitim dağılımı ile karşılaştırır.
+#
+# - Sayısal özellikler: eğitim verisinin quantile sınırlarıyla oluşturulan sabit histogram
+# - Kategorik/boolean özellikler: eğitimde görülen değerler için sayaçlar, görülmeyen tüm
+#   değerler için tek bir "diğer" sayacı (istemci ne gönderirse göndersin bellek sabit kalır)
+# - Karşılaştırma: PSI (Population Stability Index)
+#
+# Her uvicorn worker'ı kendi toplayıcısını tutar (worker başına toplama). Güncellemeler
+# yalnızca event loop thread'inden yapıldığı için kilit gerekmez.
+
+import bisect
+import math
+import os
+
+NUMERIC_BINS = 10
+PSI_EPSILON = 1e-4  # Boş kovalarda log(0) olmaması için
+MAX_UNSEEN_SAMPLES = 20  # Raporda gösterilecek, eğitimde görülmemiş değer örneği sayısı (özellik başına)
+
+def compute_training_stats(df, numerical_columns, categorical_columns, bins=NUMERIC_BINS):
+    """Eğitim verisinin dağılım özetini çıkarır (main.py'de model ile birlikte kaydedilir)"""
+    stats = {'n': len(df), 'numeric': {}, 'categorical': {}}
+
+    for col in numerical_columns:
+        values = df[col].astype(float)
+        # İç sınırlar: eşit frekanslı kovalar (tekrar eden sınırlar birleştirilir)
+        edges = sorted(set(values.quantile([i / bins for i in range(1, bins)]).tolist()))
+        counts = [0] * (len(edges) + 1)
+        for v in values:
+            counts[bisect.bisect_right(edges, v)] += 1
+        stats['numeric'][col] = {
+            'edges': edges,
+            'proportions': [c / len(values) for c in counts],
+            'mean': float(values.mean()),
+            'std': float(values.std()),
+        }
+
+    for col in categorical_columns:
+        proportions = df[col].astype(str).value_counts(normalize=True)
+        stats['categorical'][col] = {str(k): float(v) for k, v in proportions.items()}
+
+    return stats
+
+def psi(expected, actual):
+    """Population Stability Index: < 0.1 stabil, 0.1-0.25 hafif kayma, > 0.25 ciddi kayma"""
+    total = 0.0
+    for e, a in zip(expected, actual):
+        e = max(e, PSI_EPSILON)
+        a = max(a, PSI_EPSILON)
+        total += (a - e) * math.log(a / e)
+    return total
+
+def _durum(value):
+    if value < 0.1:
+        return "✅ Stabil"
+    elif value < 0.25:
+        return "⚠️ Hafif kayma"
+    return "❌ Ciddi kayma"
+
+class DriftCollector:
+    """İstek başına birkaç mikrosaniyede güncellenen sabit bellekli dağılım özeti"""
+
+    def __init__(self, training_stats):
+        self.training_stats = training_stats
+        self.n = 0
+        # Sıcak yolda sözlük araması yapmamak için (sütun, sınırlar, sayaçlar, toplamlar) listesi
+        self._numeric = [
+            (col, s['edges'], [0] * (len(s['edges']) + 1), [0.0, 0.0])
+            for col, s in training_stats['numeric'].items()
+        ]
+        # Sayaçlar yalnızca eğitim değerleri ile başlatılır, yeni anahtar eklenmez
+        self._categorical = [
+            (col, dict.fromkeys(values, 0), [0], set())  # (sütun, sayaçlar, diğer, örnekler)
+            for col, values in training_stats['categorical'].items()
+        ]
+
+    def update(self, record):
+        """Tek bir isteğin özelliklerini özetlere ekler"""
+        self.n += 1
+        for col, edges, counts, sums in self._numeric:
+            v = record[col]
+            counts[bisect.bisect_right(edges, v)] += 1
+            sums[0] += v
+            sums[1] += v * v
+        for col, counts, other, unseen in self._categorical:
+            key = str(record[col])
+            if key in counts:
+                counts[key] += 1
+            else:
+                other[0] += 1
+                if len(unseen) < MAX_UNSEEN_SAMPLES:
+                    unseen.add(key[:100])  # Çok uzun girdiler raporu şişirmesin
+
+    def report(self):
+        """Eğitim dağılımı ile karşılaştırmalı drift raporu"""
+        n = self.n
+        rapor = {
+            "worker_pid": os.getpid(),
+            "istek_sayisi": n,
+            "egitim_ornek_sayisi": self.training_stats['n'],
+            "sayisal": {},
+            "kategorik": {},
+        }
+        if n == 0:
+            return rapor
+
+        for col, _, counts, (total, total_sq) in self._numeric:
+            train = self.training_stats['numeric'][col]
+            value = psi(train['proportions'], [c / n for c in counts])
+            mean = total / n
+            std = math.sqrt(max(total_sq / n - mean * mean, 0.0))
+            rapor["sayisal"][col] = {
+                "psi": round(value, 4),
+                "durum": _durum(value),
+                "egitim_ortalama": round(train['mean'], 2),
+                "canli_ortalama": round(mean, 2),
+                "egitim_std": round(train['std'], 2),
+                "canli_std": round(std, 2),
+            }
+
+        for col, counts, other, unseen in self._categorical:
+            train = self.training_stats['categorical'][col]
+            # Eğitimde görülmeyen değerler tek kova: eğitimdeki payı 0
+            expected = [train[k] for k in counts] + [0.0]
+            actual = [c / n for c in counts.values()] + [other[0] / n]
+            value = psi(expected, actual)
+            rapor["kategorik"][col] = {
+                "psi": round(value, 4),
+                "durum": _durum(value),
+                "egitimde_olmayan_istek_sayisi": other[0],
+                "egitimde_olmayan_deger_ornekleri": sorted(unseen),
+            }
+
+        return rapor
@@ -17,6 +17,7 @@ from sklearn.preprocessing import LabelEncoder, StandardScaler
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 import pickle
 import warnings
+from drift import compute_training_stats
 warnings.filterwarnings('ignore')
 
 # Türkçe karakter desteği için matplotlib ayarları
@@ -179,12 +180,18 @@ print(f"📈 Ortalama CV R² Skoru: {cv_scores.mean():.4f} (±{cv_scores.std()*2
 # 9. MODEL KAYDETME
 print(f"\n💾 9. Model Kaydediliyor...")
 
+# Drift takibi için eğitim verisinin dağılım özeti (encode edilmemiş ham değerler)
+training_stats = compute_training_stats(
+    df.loc[X_train.index], numerical_columns, categorical_columns + boolean_columns
+)
+
 # Model ve encoder'ları kaydetme
 model_data = {
     'model': rf_model,
     'label_encoders': label_encoders,
     'feature_names': X.columns.tolist(),
     'feature_importance': feature_importance,
+    'training_stats': training_stats,
     'metrics': {
         'train_r2': train_r2,
         'test_r2': test_r2,
@@ -0,0 +1,139 @@
+# Müşteri Segmentasyonu - Hızlı Küme Atama
+# Eğitilmiş küme merkezleri bir kez yüklenir, gelen (gelir, harcama skoru) satırları
+# vektörel en yakın merkez hesabı ile kümelere atanır. Merkezine çok uzak kalan
+# müşteriler aykırı değer (outlier) olarak işaretlenir.
+
+import pickle
+import time
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+
+from segmentation import FEATURES, load_features
+from streaming_segmentation import MODEL_PATH
+
+class CentroidIndex:
+    """Önceden hesaplanmış küme merkezleri üzerinden en yakın merkez ataması"""
+
+    def __init__(self, centers, thresholds=None):
+        self.centers = np.ascontiguousarray(centers, dtype=np.float64)
+        # ||c||² bir kez hesaplanır, her atamada tekrar kullanılır
+        self.center_sq = np.einsum('ij,ij->i', self.centers, self.centers)
+        self.thresholds = None if thresholds is None else np.asarray(thresholds, dtype=np.float64)
+
+    @classmethod
+    def from_model_file(cls, path=MODEL_PATH):
+        """
+        Batch işin kaydettiği küme merkezlerini ve aykırı değer eşiklerini yükler (salt okunur)
+
+        Dosyada eşik yoksa atama yapılır ama aykırı değer işaretlenmez.
+        """
+        with open(path, 'rb') as f:
+            model_data = pickle.load(f)
+        thresholds = model_data.get('thresholds')
+        if thresholds is None:
+            print("⚠️ Model dosyasında aykırı değer eşiği yok, aykırı değer işaretleme kapalı")
+        return cls(model_data['cluster_centers'], thresholds)
+
+    @classmethod
+    def from_csv(cls, path="Mall_Customers.csv", n_clusters=5, quantile=0.99):
+        """Notebook'taki gibi KMeans(n_clusters=5) eğitip indeksi ve eşikleri oluşturur"""
+        X = load_features(path)
+        model = KMeans(n_clusters=n_clusters, random_state=42, n_init=10).fit(X)
+        index = cls(model.cluster_centers_)
+        index.calibrate(X, quantile)
+        return index
+
+    def _distances(self, X):
+        # ||x - c||² = ||x||² - 2·x·c + ||c||²  => tek bir matris çarpımı
+        x_sq = np.einsum('ij,ij->i', X, X)[:, None]
+        d2 = x_sq - 2.0 * (X @ self.centers.T) + self.center_sq
+        np.maximum(d2, 0, out=d2)  # Kayan nokta hatası ile oluşan negatifleri sıfırla
+        return d2
+
+    def calibrate(self, X, quantile=0.99):
+        """Her küme için aykırı değer eşiğini merkeze uzaklığın quantile değerinden belirler"""
+        labels, distances = self.assign(X)[:2]
+        self.thresholds = np.array([
+            np.quantile(distances[labels == c], quantile) if np.any(labels == c) else np.inf
+            for c in range(len(self.centers))
+        ])
+        return self.thresholds
+
+    @staticmethod
+    def _as_matrix(X):
+        # DataFrame verilirse yalnızca model özellikleri alınır
+        if isinstance(X, pd.DataFrame):
+            X = X[FEATURES].values
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[None, :]
+        return X
+
+    def assign(self, X):
+        """
+        Satırları en yakın merkeze atar
+
+        Dönüş: (küme etiketleri, merkeze uzaklıklar, aykırı değer maskesi)
+        """
+        X = self._as_matrix(X)
+
+        d2 = self._distances(X)
+        labels = d2.argmin(axis=1)
+        distances = np.sqrt(d2[np.arange(len(X)), labels])
+
+        if self.thresholds is None:
+            outliers = np.zeros(len(X), dtype=bool)
+        else:
+            outliers = distances > self.thresholds[labels]
+        return labels, distances, outliers
+
+    def assign_batches(self, X, batch_size=65536):
+        """Büyük girdileri sabit boyutlu parçalar halinde atar (bellek kullanımı sınırlı kalır)"""
+        X = self._as_matrix(X)
+        labels = np.empty(len(X), dtype=np.intp)
+        distances = np.empty(len(X), dtype=np.float64)
+        outliers = np.empty(len(X), dtype=bool)
+        for start in range(0, len(X), batch_size):
+            end = start + batch_size
+            labels[start:end], distances[start:end], outliers[start:end] = self.assign(X[start:end])
+        return labels, distances, outliers
+
+def benchmark(index, n_rows=1000000, batch_size=65536, random_state=42):
+    """Rastgele satırlarla saniyedeki atama sayısını ölçer"""
+    rng = np.random.RandomState(random_state)
+    X = np.column_stack([
+        rng.uniform(10, 140, n_rows),  # Yıllık gelir (k$)
+        rng.uniform(1, 100, n_rows),   # Harcama skoru
+    ])
+    start = time.perf_counter()
+    _, _, outliers = index.assign_batches(X, batch_size)
+    elapsed = time.perf_counter() - start
+    return {
+        "satir_sayisi": n_rows,
+        "batch_boyutu": batch_size,
+        "sure_sn": elapsed,
+        "satir_per_sn": n_rows / elapsed,
+        "aykiri_oran": float(outliers.mean()),
+    }
+
+if __name__ == "__main__":
+    print("🏷️ Müşteri Segmentasyonu - Küme Atama Servisi")
+    print("=" * 50)
+
+    # Batch işin (streaming_segmentation.py) kaydettiği eğitilmiş merkezler kullanılır
+    index = CentroidIndex.from_model_file()
+    print(f"📍 Küme merkezleri:\n{index.centers.round(2)}")
+    if index.thresholds is not None:
+        print(f"📏 Aykırı değer eşikleri: {index.thresholds.round(2)}")
+
+    labels, distances, outliers = index.assign([[15, 80], [70, 50], [140, 5]])
+    print(f"\n🎯 Kümeler: {labels}")
+    print(f"📏 Uzaklıklar: {distances.round(2)}")
+    print(f"⚠️ Aykırı değerler: {outliers}")
+
+    sonuc = benchmark(index)
+    print(f"\n⚡ THROUGHPUT:")
+    print(f"   {sonuc['satir_sayisi']:,} satır {sonuc['sure_sn']:.3f} sn içinde atandı")
+    print(f"   Saniyede {sonuc['satir_per_sn']:,.0f} satır")
+    print(f"   Aykırı değer oranı: %{sonuc['aykiri_oran']*100:.1f}")
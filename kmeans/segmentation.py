@@ -0,0 +1,93 @@
+# Müşteri Segmentasyonu - K Seçim Motoru
+# kmeans.ipynb içindeki elbow_method ve silh_method fonksiyonlarının tek çağrılık,
+# paralel çalışan versiyonu. Tüm k değerleri için KMeans çekirdeklere dağıtılarak eğitilir,
+# ikili uzaklık matrisi yalnızca bir kez hesaplanır ve tüm silhouette skorlarında tekrar kullanılır.
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.cluster import KMeans
+from sklearn.metrics import pairwise_distances, silhouette_score, davies_bouldin_score
+
+# Notebook'ta kullanılan özellikler
+FEATURES = ["Annual Income (k$)", "Spending Score (1-100)"]
+
+# Bu satır sayısının üzerinde silhouette örneklem üzerinden hesaplanır (n² bellek sınırı)
+SILHOUETTE_SAMPLE_SIZE = 5000
+
+def load_features(path="Mall_Customers.csv"):
+    """CSV dosyasından özellik matrisini yükler"""
+    df = pd.read_csv(path, usecols=FEATURES)
+    return df[FEATURES].values.astype(np.float64)
+
+def _fit_kmeans(X, k, random_state):
+    # Her işçi süreç tek bir k değeri için modeli eğitir
+    model = KMeans(n_clusters=k, random_state=random_state, n_init=10)
+    labels = model.fit_predict(X)
+    return k, labels, model.inertia_, model.cluster_centers_
+
+def select_k(X, k_range=range(2, 11), n_jobs=-1, random_state=42,
+             sample_size=SILHOUETTE_SAMPLE_SIZE):
+    """
+    Verilen k aralığı için inertia, silhouette ve Davies-Bouldin skorlarını tek seferde hesaplar
+
+    - **X**: Özellik matrisi (n_samples, n_features)
+    - **k_range**: Denenecek küme sayıları
+    - **n_jobs**: Paralel süreç sayısı (-1 => tüm çekirdekler)
+    - **sample_size**: Bu sayıdan büyük tablolarda silhouette örneklem üzerinden hesaplanır
+
+    Dönüş: k değerine göre indekslenmiş metrik tablosu (DataFrame)
+    """
+    X = np.asarray(X, dtype=np.float64)
+    n_samples = X.shape[0]
+
+    # Büyük tablolarda O(n²) uzaklık matrisi yerine sabit bir örneklem kullanılır.
+    # Örneklem bir kez seçilir ki tüm k değerleri aynı noktalar üzerinden karşılaştırılsın.
+    if sample_size is not None and n_samples > sample_size:
+        rng = np.random.RandomState(random_state)
+        sample_idx = rng.choice(n_samples, sample_size, replace=False)
+    else:
+        sample_idx = np.arange(n_samples)
+
+    # İkili uzaklık matrisi yalnızca bir kez hesaplanır
+    distances = pairwise_distances(X[sample_idx], n_jobs=n_jobs)
+
+    # Tüm k değerleri için modeller paralel eğitilir
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_fit_kmeans)(X, k, random_state) for k in k_range
+    )
+
+    rows = []
+    for k, labels, inertia, centers in results:
+        sample_labels = labels[sample_idx]
+        rows.append({
+            "k": k,
+            "inertia": inertia,
+            "silhouette": silhouette_score(distances, sample_labels, metric="precomputed"),
+            # Davies-Bouldin küme merkezlerine olan uzaklıklardan hesaplanır, O(n·k)
+            "davies_bouldin": davies_bouldin_score(X, labels),
+        })
+
+    return pd.DataFrame(rows).set_index("k")
+
+def best_k(scores):
+    """Metrik tablosundan önerilen k değerlerini döner"""
+    return {
+        "silhouette": int(scores["silhouette"].idxmax()),  # Büyük olan daha iyi
+        "davies_bouldin": int(scores["davies_bouldin"].idxmin()),  # Küçük olan daha iyi
+    }
+
+if __name__ == "__main__":
+    print("👥 Müşteri Segmentasyonu - K Seçimi")
+    print("=" * 50)
+
+    X = load_features()
+    print(f"📋 Veri şekli: {X.shape}")
+
+    scores = select_k(X)
+    print(f"\n📊 K SEÇİM METRİKLERİ:")
+    print(scores.round(4))
+
+    onerilen = best_k(scores)
+    print(f"\n🎯 Silhouette'e göre en iyi k: {onerilen['silhouette']}")
+    print(f"🎯 Davies-Bouldin'e göre en iyi k: {onerilen['davies_bouldin']}")
@@ -0,0 +1,158 @@
+# Müşteri Segmentasyonu - Akış (Streaming) Modu
+# Milyonlarca satırlık müşteri tablosu belleğe tek seferde alınmadan parça parça okunur,
+# küme merkezleri MiniBatchKMeans.partial_fit ile artımlı olarak güncellenir.
+# Batch iş ve online iş aynı model dosyasını paylaşır.
+
+import os
+import pickle
+import numpy as np
+import pandas as pd
+from sklearn.cluster import MiniBatchKMeans
+
+from segmentation import FEATURES
+
+MODEL_PATH = "musteri_segment_modeli.pkl"
+
+def iter_feature_chunks(path, chunk_size=100000):
+    """CSV dosyasını parça parça okuyup özellik matrislerini üretir"""
+    for chunk in pd.read_csv(path, usecols=FEATURES, chunksize=chunk_size):
+        yield chunk[FEATURES].values.astype(np.float64)
+
+def create_model(n_clusters=5, batch_size=4096, random_state=42):
+    """Boş bir MiniBatchKMeans modeli oluşturur"""
+    return MiniBatchKMeans(n_clusters=n_clusters, batch_size=batch_size,
+                           random_state=random_state, n_init=3)
+
+def _fit_slices(model, X, rng):
+    # partial_fit her çağrıda tek bir mini-batch adımı atar => parça batch_size'lık dilimlere bölünür.
+    # Dosya sıralı olabilir (örn. gelire göre), bu yüzden satırlar parça içinde karıştırılır.
+    X = X[rng.permutation(len(X))]
+    for start in range(0, len(X), model.batch_size):
+        model.partial_fit(X[start:start + model.batch_size])
+
+def partial_fit_csv(path, model=None, chunk_size=100000, n_passes=1, random_state=42):
+    """
+    CSV dosyasındaki müşterilerle modeli artımlı olarak günceller
+
+    - **n_passes**: Dosya üzerinden kaç kez geçileceği. Küçük veya ilk kez eğitilen tablolarda
+      merkezlerin oturması için yeterli sayıda mini-batch adımı atılmasını sağlar.
+
+    Model verilmezse yeni bir model oluşturulur. Verilirse (örn. load_model ile yüklenen)
+    kaldığı yerden eğitime devam edilir, yeniden eğitim yapılmaz.
+    """
+    model = model if model is not None else create_model()
+    rng = np.random.RandomState(random_state)
+    pending = None  # Model başlatılmadan önce gelen parçalar burada biriktirilir
+    n_seen = 0
+
+    for _ in range(n_passes):
+        for X in iter_feature_chunks(path, chunk_size):
+            if not hasattr(model, "cluster_centers_"):
+                # Merkezler ilk mini-batch'ten başlatılır => en az bir batch dolana kadar bekle
+                pending = X if pending is None else np.vstack([pending, X])
+                if len(pending) < model.batch_size:
+                    continue
+                X, pending = pending, None
+            _fit_slices(model, X, rng)
+            n_seen += len(X)
+
+        # Tablo tek bir batch'ten küçükse eldeki satırlarla başlatılır
+        if pending is not None and len(pending) >= model.n_clusters:
+            _fit_slices(model, pending, rng)
+            n_seen += len(pending)
+            pending = None
+
+    if not hasattr(model, "cluster_centers_"):
+        raise ValueError(f"Model için en az {model.n_clusters} müşteri gerekli")
+
+    print(f"✅ {n_seen:,} müşteri satırı ile merkezler güncellendi ({model.n_steps_:,} adım)")
+    return model
+
+def calibrate_thresholds(model, path, chunk_size=100000, quantile=0.99,
+                         sample_size=10000, random_state=42):
+    """
+    Her küme için aykırı değer eşiğini (merkeze uzaklığın quantile değeri) hesaplar
+
+    Dosya parça parça okunur; her küme için en fazla sample_size uzaklık rezervuar
+    örneklemesi ile tutulduğu için bellek kullanımı tablo boyutundan bağımsızdır.
+    """
+    rng = np.random.RandomState(random_state)
+    k = model.n_clusters
+    samples = [np.empty(0) for _ in range(k)]
+    seen = np.zeros(k, dtype=np.int64)
+
+    for X in iter_feature_chunks(path, chunk_size):
+        distances = model.transform(X)
+        labels = distances.argmin(axis=1)
+        distances = distances[np.arange(len(X)), labels]
+        for c in range(k):
+            d = distances[labels == c]
+            if not len(d):
+                continue
+            # Önce rezervuar doldurulur
+            room = sample_size - len(samples[c])
+            if room > 0:
+                samples[c] = np.concatenate([samples[c], d[:room]])
+                seen[c] += min(room, len(d))
+                d = d[room:]
+            if len(d):
+                # Rezervuar örneklemesi: t. eleman sample_size / t olasılıkla yer alır
+                t = seen[c] + np.arange(1, len(d) + 1)
+                accepted = rng.random_sample(len(d)) < sample_size / t
+                samples[c][rng.randint(0, sample_size, accepted.sum())] = d[accepted]
+                seen[c] += len(d)
+
+    return np.array([np.quantile(s, quantile) if len(s) else np.inf for s in samples])
+
+def save_model(model, path=MODEL_PATH, thresholds=None):
+    """Modeli, küme merkezlerini ve aykırı değer eşiklerini kaydeder"""
+    model_data = {
+        'model': model,
+        'cluster_centers': model.cluster_centers_,
+        'thresholds': thresholds,
+        'feature_names': FEATURES,
+    }
+    # Online servis dosyayı okurken yarım yazılmış bir dosya görmesin
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(model_data, f)
+    os.replace(tmp_path, path)
+    print(f"💾 Model '{path}' olarak kaydedildi!")
+
+def load_model(path=MODEL_PATH):
+    """Kaydedilmiş modeli yükler"""
+    with open(path, 'rb') as f:
+        model_data = pickle.load(f)
+    return model_data['model']
+
+def assign_clusters(model, customers):
+    """Yeni müşterileri modeli yeniden eğitmeden kümelere atar"""
+    if isinstance(customers, pd.DataFrame):
+        customers = customers[FEATURES].values
+    return model.predict(np.asarray(customers, dtype=np.float64))
+
+def assign_csv(model, path, output_path, chunk_size=100000):
+    """CSV'deki müşterileri parça parça kümelere atayıp sonucu yeni bir CSV'ye yazar"""
+    header = True
+    for chunk in pd.read_csv(path, chunksize=chunk_size):
+        chunk['cluster'] = assign_clusters(model, chunk)
+        chunk.to_csv(output_path, mode='w' if header else 'a', header=header, index=False)
+        header = False
+    print(f"✅ Küme atamaları '{output_path}' dosyasına yazıldı")
+
+if __name__ == "__main__":
+    print("👥 Müşteri Segmentasyonu - Akış Modu")
+    print("=" * 50)
+
+    # Batch iş: merkezleri parça parça güncelle ve kaydet
+    model = partial_fit_csv("Mall_Customers.csv", chunk_size=50, n_passes=100)
+    thresholds = calibrate_thresholds(model, "Mall_Customers.csv", chunk_size=50)
+    save_model(model, thresholds=thresholds)
+
+    # Online iş: kaydedilen modeli yükle ve yeni müşterileri ata
+    model = load_model()
+    new_customers = pd.DataFrame({
+        "Annual Income (k$)": [15, 70, 120],
+        "Spending Score (1-100)": [80, 50, 20],
+    })
+    print(f"\n🏷️ Yeni müşteri kümeleri: {assign_clusters(model, new_customers)}")
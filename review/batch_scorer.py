@@ -0,0 +1,131 @@
+# Yorum Duygu Analizi - Toplu Puanlama
+# Dışa aktarılan TFLite modeli ile yorumları toplu halinde puanlar. Her batch yalnızca
+# içindeki en uzun yoruma kadar doldurulur (padding) ve yorumlar uzunluğa göre sıralanarak
+# gruplanır. Model padding'i maskelediği için (Embedding mask_zero=True) skor, yorumun
+# doldurulduğu uzunluktan etkilenmez. Çalıştırıldığında orijinal Keras modeli ile gecikme
+# ve doğruluk karşılaştırılır.
+
+import json
+import os
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from export_model import TFLITE_INT8_PATH, TFLITE_PATH, VOCAB_PATH
+from train_pipeline import MAXLEN
+
+class ReviewScorer:
+    """TFLite modeli ile çok thread'li toplu yorum puanlayıcı"""
+
+    def __init__(self, model_path=TFLITE_PATH, vocab_path=VOCAB_PATH, num_threads=None, maxlen=MAXLEN):
+        with open(vocab_path, encoding='utf-8') as f:
+            vocab = json.load(f)
+        self.word_index = vocab["word_index"]
+        self.oov_index = vocab["oov_index"]
+        self.lower = vocab["lower"]
+        self.split = vocab["split"]
+        # Keras Tokenizer filtrelerindeki karakterler ayraç ile değiştirilir
+        self.filter_table = str.maketrans({c: self.split for c in vocab["filters"]})
+        self.maxlen = maxlen
+
+        self.interpreter = tf.lite.Interpreter(
+            model_path=model_path, num_threads=num_threads or os.cpu_count()
+        )
+        self.input_index = self.interpreter.get_input_details()[0]["index"]
+        self.output_index = self.interpreter.get_output_details()[0]["index"]
+        self._input_shape = None
+
+    def tokenize(self, text):
+        """Keras Tokenizer.texts_to_sequences ile aynı indeksleri üretir"""
+        if self.lower:
+            text = text.lower()
+        words = text.translate(self.filter_table).split(self.split)
+        seq = [self.word_index.get(w, self.oov_index) for w in words if w]
+        # pad_sequences gibi son maxlen token tutulur; boş yorum tek bir OOV token olur (0 maskelenir)
+        return seq[-self.maxlen:] or [self.oov_index]
+
+    def _run(self, batch):
+        if batch.shape != self._input_shape:
+            self.interpreter.resize_tensor_input(self.input_index, batch.shape)
+            self.interpreter.allocate_tensors()
+            self._input_shape = batch.shape
+        self.interpreter.set_tensor(self.input_index, batch)
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self.output_index)[:, 0]
+
+    def score(self, texts, batch_size=256, pad_to=None):
+        """
+        Yorumların puanlarını girdi sırasıyla döner
+
+        - **pad_to**: None => her batch içindeki en uzun yoruma kadar doldurulur,
+          sayı => tüm batch'ler bu uzunluğa doldurulur (Keras referansı ile aynı girdi)
+        """
+        sequences = [self.tokenize(text) for text in texts]
+        order = np.argsort([len(seq) for seq in sequences], kind="stable")
+        scores = np.empty(len(sequences), dtype=np.float32)
+
+        for start in range(0, len(order), batch_size):
+            idx = order[start:start + batch_size]
+            longest = pad_to or max(len(sequences[i]) for i in idx)
+            batch = np.zeros((len(idx), longest), dtype=np.int32)  # padding="post"
+            for row, i in enumerate(idx):
+                batch[row, :len(sequences[i])] = sequences[i]
+            scores[idx] = self._run(batch)
+        return scores
+
+def benchmark(n_keras=200, batch_size=256):
+    """Orijinal Keras modeli ile TFLite (fp32 ve int8) puanlayıcılarını karşılaştırır"""
+    from sklearn.model_selection import train_test_split
+    from tensorflow.keras.preprocessing.sequence import pad_sequences
+    from tensorflow.keras.preprocessing.text import tokenizer_from_json
+
+    from data_loading import load_reviews
+    from train_pipeline import MODEL_PATH, TOKENIZER_PATH
+
+    df = load_reviews()
+    _, X_test, _, y_test = train_test_split(
+        df['review'].values, df['rating'].values, test_size=0.3, random_state=42
+    )
+    y_test = y_test.astype(np.float32)
+
+    # Orijinal yol: yorum başına Keras predict, 50 uzunluğa padding (tokenize ile aynı: boş => OOV)
+    model = tf.keras.models.load_model(MODEL_PATH)
+    with open(TOKENIZER_PATH, encoding='utf-8') as f:
+        tokenizer = tokenizer_from_json(f.read())
+    oov_index = tokenizer.word_index[tokenizer.oov_token]
+    sequences = [seq or [oov_index] for seq in tokenizer.texts_to_sequences(X_test)]
+    X_pad = pad_sequences(sequences, maxlen=MAXLEN, padding="post")
+
+    n = min(n_keras, len(X_pad))
+    start = time.perf_counter()
+    keras_scores = np.array([model.predict(X_pad[i:i + 1], verbose=0)[0, 0] for i in range(n)])
+    keras_ms = (time.perf_counter() - start) * 1000 / n
+    full_keras = model.predict(X_pad, batch_size=batch_size, verbose=0)[:, 0]
+
+    print(f"\n📊 {'Yol':28s} {'ms/yorum':>10s} {'MAE':>8s} {'Keras farkı':>12s}")
+    print("-" * 62)
+    print(f"{'Keras (tek tek, pad=50)':28s} {keras_ms:10.3f} "
+          f"{np.mean(np.abs(full_keras - y_test)):8.4f} {np.mean(np.abs(keras_scores - full_keras[:n])):12.4f}")
+
+    # "pad=50" satırı Keras ile birebir aynı girdiyi kullanır => fark yalnızca dönüştürme hatasıdır.
+    # Maskeli modelde "batch" satırlarının farkı da aynı kalmalı (padding skoru etkilemez);
+    # int8 satırındaki ek fark kuantizasyondan gelir.
+    runs = [
+        (f"TFLite fp32 (batch, pad={MAXLEN})", TFLITE_PATH, MAXLEN),
+        ("TFLite fp32 (batch)", TFLITE_PATH, None),
+        ("TFLite int8 (batch)", TFLITE_INT8_PATH, None),
+    ]
+    for name, path, pad_to in runs:
+        scorer = ReviewScorer(model_path=path)
+        scorer.score(X_test[:batch_size], batch_size, pad_to)  # Isınma turu
+        start = time.perf_counter()
+        scores = scorer.score(X_test, batch_size, pad_to)
+        ms = (time.perf_counter() - start) * 1000 / len(X_test)
+        print(f"{name:28s} {ms:10.3f} {np.mean(np.abs(scores - y_test)):8.4f} "
+              f"{np.mean(np.abs(scores - full_keras)):12.4f}")
+
+if __name__ == "__main__":
+    print("💬 Yorum Duygu Analizi - Toplu Puanlama Benchmark")
+    print("=" * 50)
+    benchmark()
@@ -0,0 +1,126 @@
+# Yorum Duygu Analizi - Veri Yükleme
+# Notebook'taki pd.read_sql("Select * from users") tüm tabloyu belleğe alıyordu.
+# Bu modül yalnızca review ve rating sütunlarını sunucu taraflı cursor ile sabit boyutlu
+# parçalar halinde okur, havuzdaki bağlantıları tekrar kullanır ve sonucu yerel bir
+# Parquet dosyasına yazar. Sonraki eğitimler veritabanına gitmeden bu dosyayı okur.
+
+import os
+import sqlite3
+import uuid
+from contextlib import contextmanager
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+COLUMNS = ["review", "rating"]
+TABLE = "users"
+CACHE_PATH = "reviews.parquet"
+CHUNK_SIZE = 10000
+
+# Bağlantı bilgileri ortam değişkenlerinden okunur
+DB_CONFIG = {
+    "dbname": os.environ.get("REVIEW_DB_NAME", "testdb"),
+    "user": os.environ.get("REVIEW_DB_USER", "postgres"),
+    "password": os.environ.get("REVIEW_DB_PASSWORD", ""),
+    "host": os.environ.get("REVIEW_DB_HOST", "193.203.191.79"),
+    "port": os.environ.get("REVIEW_DB_PORT", "32001"),
+}
+
+SCHEMA = pa.schema([("review", pa.string()), ("rating", pa.float64())])
+
+# Global bağlantı havuzu
+connection_pool = None
+
+def get_pool(minconn=1, maxconn=4, **config):
+    """PostgreSQL bağlantı havuzunu ilk çağrıda oluşturur, sonra aynısını döner"""
+    global connection_pool
+    if connection_pool is None:
+        from psycopg2.pool import ThreadedConnectionPool
+        connection_pool = ThreadedConnectionPool(minconn, maxconn, **{**DB_CONFIG, **config})
+    return connection_pool
+
+@contextmanager
+def pooled_connection():
+    """Havuzdan bağlantı alır, iş bitince havuza geri verir"""
+    pool = get_pool()
+    connection = pool.getconn()
+    try:
+        yield connection
+    finally:
+        pool.putconn(connection)
+
+def iter_review_chunks(connection, chunk_size=CHUNK_SIZE, table=TABLE):
+    """
+    review ve rating sütunlarını parça parça DataFrame olarak üretir
+
+    PostgreSQL bağlantılarında isimli (sunucu taraflı) cursor kullanılır, böylece satırlar
+    sunucudan chunk_size kadar çekilir. SQLite cursor'ları zaten satırları tembel (lazy) okur.
+    """
+    query = f"SELECT {', '.join(COLUMNS)} FROM {table}"
+
+    if isinstance(connection, sqlite3.Connection):
+        cursor = connection.cursor()
+    else:
+        # İsimli cursor => sunucu taraflı cursor (transaction içinde yaşar)
+        cursor = connection.cursor(name=f"reviews_{uuid.uuid4().hex}")
+        cursor.itersize = chunk_size
+
+    try:
+        cursor.execute(query)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield pd.DataFrame(rows, columns=COLUMNS)
+    finally:
+        cursor.close()
+        if not isinstance(connection, sqlite3.Connection):
+            connection.rollback()  # Salt okunur transaction'ı kapat
+
+def write_cache(chunks, path=CACHE_PATH):
+    """Parçaları tek bir Parquet dosyasına akış halinde yazar"""
+    n_rows = 0
+    tmp_path = f"{path}.tmp"
+    with pq.ParquetWriter(tmp_path, SCHEMA) as writer:
+        for chunk in chunks:
+            chunk = chunk.astype({"review": "string", "rating": "float64"})
+            writer.write_table(pa.Table.from_pandas(chunk, schema=SCHEMA, preserve_index=False))
+            n_rows += len(chunk)
+    # Yarım kalan yazım geçerli bir önbellek gibi görünmesin
+    os.replace(tmp_path, path)
+    return n_rows
+
+def load_reviews(connection=None, cache_path=CACHE_PATH, refresh=False, chunk_size=CHUNK_SIZE):
+    """
+    Yorumları döner: önbellek varsa Parquet'ten, yoksa veritabanından okuyup önbelleğe yazar
+
+    - **connection**: Kullanılacak bağlantı (verilmezse PostgreSQL havuzundan alınır)
+    - **refresh**: True => önbellek yok sayılıp veritabanından yeniden okunur
+    """
+    if refresh or not os.path.exists(cache_path):
+        if connection is None:
+            with pooled_connection() as conn:
+                n_rows = write_cache(iter_review_chunks(conn, chunk_size), cache_path)
+        else:
+            n_rows = write_cache(iter_review_chunks(connection, chunk_size), cache_path)
+        print(f"💾 {n_rows:,} yorum '{cache_path}' önbelleğine yazıldı")
+
+    return pd.read_parquet(cache_path, columns=COLUMNS)
+
+if __name__ == "__main__":
+    import sys
+
+    print("💬 Yorum Duygu Analizi - Veri Yükleme")
+    print("=" * 50)
+
+    # python data_loading.py yorumlar.db => yerel SQLite dosyası ile çalışır
+    if len(sys.argv) > 1:
+        connection = sqlite3.connect(sys.argv[1])
+        df = load_reviews(connection, refresh=True)
+        connection.close()
+    else:
+        df = load_reviews()
+
+    print(f"📋 Veri şekli: {df.shape}")
+    print(df.head(3))
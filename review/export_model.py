@@ -0,0 +1,66 @@
+# Yorum Duygu Analizi - Model Dışa Aktarma
+# Eğitilmiş Keras modelini CPU'da servis edilebilecek dondurulmuş (frozen) bir TFLite
+# grafiğine çevirir, istenirse ağırlıkları int8'e kuantize eder. Tokenizer'ın kelime
+# dağarcığı da Keras'a ihtiyaç duymadan okunabilecek bir JSON dosyasına yazılır.
+
+import json
+
+import tensorflow as tf
+from tensorflow.keras.preprocessing.text import tokenizer_from_json
+
+from train_pipeline import MODEL_PATH, NUM_WORDS, TOKENIZER_PATH
+
+VOCAB_PATH = "review_vocab.json"
+TFLITE_PATH = "review_model.tflite"
+TFLITE_INT8_PATH = "review_model_int8.tflite"
+
+def export_vocab(tokenizer_path=TOKENIZER_PATH, vocab_path=VOCAB_PATH, num_words=NUM_WORDS):
+    """Modelin gördüğü ilk num_words kelimeyi ve OOV indeksini JSON olarak kaydeder"""
+    with open(tokenizer_path, encoding='utf-8') as f:
+        tokenizer = tokenizer_from_json(f.read())
+
+    vocab = {
+        "num_words": num_words,
+        "oov_index": tokenizer.word_index[tokenizer.oov_token],
+        "filters": tokenizer.filters,
+        "lower": tokenizer.lower,
+        "split": tokenizer.split,
+        "word_index": {w: i for w, i in tokenizer.word_index.items() if i < num_words},
+    }
+    with open(vocab_path, 'w', encoding='utf-8') as f:
+        json.dump(vocab, f, ensure_ascii=False)
+    print(f"💾 Kelime dağarcığı '{vocab_path}' olarak kaydedildi ({len(vocab['word_index']):,} kelime)")
+
+def export_tflite(model_path=MODEL_PATH, output_path=TFLITE_PATH, quantize=False):
+    """
+    Keras modelini değişken batch ve uzunluklu TFLite grafiğine çevirir
+
+    - **quantize**: True => ağırlıklar int8 olarak saklanır (dinamik aralık kuantizasyonu)
+    """
+    model = tf.keras.models.load_model(model_path)
+
+    @tf.function(input_signature=[tf.TensorSpec([None, None], tf.int32, name="sequences")])
+    def serve(sequences):
+        # Embedding maskesi (mask_zero) grafiğe dahil edilir => padding skoru etkilemez
+        return model(sequences, training=False)
+
+    converter = tf.lite.TFLiteConverter.from_concrete_functions([serve.get_concrete_function()], model)
+    converter.target_spec.supported_ops = [
+        tf.lite.OpsSet.TFLITE_BUILTINS,
+        tf.lite.OpsSet.SELECT_TF_OPS,  # Dinamik uzunluklu LSTM için gerekebilir
+    ]
+    if quantize:
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+
+    tflite_model = converter.convert()
+    with open(output_path, 'wb') as f:
+        f.write(tflite_model)
+    print(f"💾 {'int8 ' if quantize else ''}TFLite modeli '{output_path}' olarak kaydedildi "
+          f"({len(tflite_model) / 1024:,.0f} KB)")
+
+if __name__ == "__main__":
+    print("📦 Yorum Duygu Analizi - Model Dışa Aktarma")
+    print("=" * 50)
+    export_vocab()
+    export_tflite()
+    export_tflite(output_path=TFLITE_INT8_PATH, quantize=True)
@@ -0,0 +1,160 @@
+# Yorum Duygu Analizi - Eğitim Girdi Pipeline'ı
+# Notebook'ta model batch_size=3 ile, Python listelerinde hesaplanıp 50 uzunluğa
+# doldurulmuş (padding) yoğun dizilerle eğitiliyordu. Bu script:
+# - Tokenize edilmiş dizileri diske önbellekler (tokenizer her çalıştırmada yeniden çalışmaz)
+# - Dizileri uzunluklarına göre kovalara ayırıp batch'ler (gereksiz padding azalır)
+# - Embedding mask_zero=True => padding (0) LSTM'e girmez, skor batch'in doldurulduğu uzunluğa bağlı olmaz
+# - Batch'leri tf.data ile paralel olarak önceden hazırlar (prefetch)
+# - Her epoch için saniyede işlenen örnek sayısını raporlar
+
+import hashlib
+import os
+import time
+
+import numpy as np
+import tensorflow as tf
+from sklearn.model_selection import train_test_split
+from tensorflow.keras.preprocessing.text import Tokenizer, tokenizer_from_json
+
+from data_loading import load_reviews
+
+NUM_WORDS = 10000
+MAXLEN = 50
+BATCH_SIZE = 64
+BUCKET_BOUNDARIES = [10, 20, 30, 40]
+CACHE_DIR = "cache"
+TOKENIZER_PATH = "review_tokenizer.json"
+MODEL_PATH = "review_model.keras"
+
+def build_model(vocab_size=NUM_WORDS):
+    """Notebook'taki Embedding + Bidirectional LSTM modeli (değişken uzunluklu, maskeli girdi)"""
+    model = tf.keras.Sequential([
+        tf.keras.layers.Input(shape=(None,), dtype="int32"),
+        tf.keras.layers.Embedding(input_dim=vocab_size, output_dim=64, mask_zero=True),
+        tf.keras.layers.Bidirectional(tf.keras.layers.LSTM(64)),
+        tf.keras.layers.Dense(32, activation='relu'),
+        tf.keras.layers.Dropout(0.4),
+        tf.keras.layers.Dense(1, activation='linear')
+    ])
+    model.compile(loss='mean_squared_error', optimizer='adam', metrics=['mae'])
+    return model
+
+def _to_ragged_arrays(sequences, maxlen=MAXLEN):
+    # pad_sequences varsayılanı truncating='pre' => son maxlen token tutulur.
+    # Boş diziler tek bir OOV (1) token ile temsil edilir: LSTM 0 uzunluklu girdi kabul etmez,
+    # 0 ise padding olarak maskelenir.
+    sequences = [seq[-maxlen:] or [1] for seq in sequences]
+    lengths = np.array([len(seq) for seq in sequences], dtype=np.int64)
+    row_splits = np.concatenate([[0], np.cumsum(lengths)])
+    values = np.fromiter((tok for seq in sequences for tok in seq), dtype=np.int32, count=row_splits[-1])
+    return values, row_splits
+
+def _cache_key(texts, num_words, maxlen):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{num_words}:{maxlen}:".encode())
+    for text in texts:
+        h.update(str(text).encode('utf-8'))
+        h.update(b"\0")
+    return h.hexdigest()
+
+def tokenize_cached(X_train, X_test, num_words=NUM_WORDS, maxlen=MAXLEN, cache_dir=CACHE_DIR):
+    """
+    Metinleri tokenize eder; aynı veri ve ayarlar için sonuç diskten okunur
+
+    Dönüş: (tokenizer, (train_values, train_splits), (test_values, test_splits))
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    key = _cache_key(list(X_train) + list(X_test), num_words, maxlen)
+    seq_path = os.path.join(cache_dir, f"sequences_{key}.npz")
+    tok_path = os.path.join(cache_dir, f"tokenizer_{key}.json")
+
+    if os.path.exists(seq_path) and os.path.exists(tok_path):
+        print(f"📦 Tokenize edilmiş diziler önbellekten okundu: {seq_path}")
+        with open(tok_path, encoding='utf-8') as f:
+            tokenizer = tokenizer_from_json(f.read())
+        data = np.load(seq_path)
+        return tokenizer, (data["train_values"], data["train_splits"]), (data["test_values"], data["test_splits"])
+
+    tokenizer = Tokenizer(num_words=num_words, oov_token='<OOV>')
+    tokenizer.fit_on_texts(X_train)
+    train = _to_ragged_arrays(tokenizer.texts_to_sequences(X_train), maxlen)
+    test = _to_ragged_arrays(tokenizer.texts_to_sequences(X_test), maxlen)
+
+    np.savez(seq_path, train_values=train[0], train_splits=train[1],
+             test_values=test[0], test_splits=test[1])
+    with open(tok_path, 'w', encoding='utf-8') as f:
+        f.write(tokenizer.to_json())
+    print(f"💾 Tokenize edilmiş diziler önbelleğe yazıldı: {seq_path}")
+    return tokenizer, train, test
+
+def make_dataset(values, row_splits, labels, batch_size=BATCH_SIZE, shuffle=False, seed=42):
+    """Uzunluğa göre kovalanmış, önceden hazırlanan (prefetch) tf.data pipeline'ı"""
+    sequences = tf.RaggedTensor.from_row_splits(values, row_splits)
+    ds = tf.data.Dataset.from_tensor_slices((sequences, np.asarray(labels, dtype=np.float32)))
+    if shuffle:
+        ds = ds.shuffle(len(labels), seed=seed, reshuffle_each_iteration=True)
+    ds = ds.bucket_by_sequence_length(
+        element_length_func=lambda seq, label: tf.shape(seq)[0],
+        bucket_boundaries=BUCKET_BOUNDARIES,
+        bucket_batch_sizes=[batch_size] * (len(BUCKET_BOUNDARIES) + 1),
+        padded_shapes=([None], []),
+    )
+    return ds.prefetch(tf.data.AUTOTUNE)
+
+class ThroughputCallback(tf.keras.callbacks.Callback):
+    """Her epoch'un eğitim kısmında saniyede işlenen örnek sayısını raporlar"""
+
+    def __init__(self, n_samples):
+        super().__init__()
+        self.n_samples = n_samples
+        self.samples_per_sec = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._start = time.perf_counter()
+        self._train_end = None
+
+    def on_test_begin(self, logs=None):
+        # Validasyon süresi throughput'a dahil edilmez
+        if self._train_end is None:
+            self._train_end = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        train_end = self._train_end or time.perf_counter()
+        rate = self.n_samples / (train_end - self._start)
+        self.samples_per_sec.append(rate)
+        print(f"⚡ Epoch {epoch + 1}: saniyede {rate:,.0f} örnek")
+
+def train(batch_size=BATCH_SIZE, epochs=3, intra_op_threads=0, inter_op_threads=0):
+    """
+    Modeli eğitir ve kaydeder
+
+    - **batch_size**: CPU'da 3 yerine daha büyük batch'ler kullanılır (varsayılan 64)
+    - **intra_op_threads / inter_op_threads**: TensorFlow thread sayıları (0 => otomatik)
+    """
+    tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+    tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+
+    df = load_reviews()
+    X_train, X_test, y_train, y_test = train_test_split(
+        df['review'].values, df['rating'].values, test_size=0.3, random_state=42
+    )
+
+    tokenizer, train_seq, test_seq = tokenize_cached(X_train, X_test)
+    train_ds = make_dataset(*train_seq, y_train, batch_size, shuffle=True)
+    test_ds = make_dataset(*test_seq, y_test, batch_size)
+
+    model = build_model()
+    throughput = ThroughputCallback(len(y_train))
+    history = model.fit(train_ds, epochs=epochs, validation_data=test_ds, callbacks=[throughput])
+
+    model.save(MODEL_PATH)
+    with open(TOKENIZER_PATH, 'w', encoding='utf-8') as f:
+        f.write(tokenizer.to_json())
+    print(f"💾 Model '{MODEL_PATH}', tokenizer '{TOKENIZER_PATH}' olarak kaydedildi!")
+    return model, history, throughput.samples_per_sec
+
+if __name__ == "__main__":
+    print("💬 Yorum Duygu Analizi - Model Eğitimi")
+    print("=" * 50)
+    _, _, rates = train()
+    print(f"\n📊 Ortalama throughput: saniyede {np.mean(rates):,.0f} örnek")